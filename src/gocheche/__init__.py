@@ -0,0 +1 @@
+from gocheche._version import __version__
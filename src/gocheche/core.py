@@ -0,0 +1,223 @@
+import argparse
+import datetime
+import functools
+import logging
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+class Customer():
+    """Defines a customer: address, customer number, lat/long, whether it is in need of delivery, delivery date, delivery order."""
+
+    __slots__ = (
+        'cust_id',
+        'name',
+        'address',
+        'lat',
+        'lon',
+        'visit',
+        'delivery_day',
+        'delivery_order',
+    )
+
+    def __init__(
+        self,
+        cust_id: str,
+        name: str,
+        address: str,
+        latitude: float,
+        longitude: float,
+        visit: bool = False,
+        delivery_day: Optional[str] = None,
+        delivery_order: int = -1,
+    ):
+        """Creates a customer.
+        
+        Fields:
+
+            cust_id: unique customer identifier
+            name: customer's name
+            address: customer's address
+            lat: customer's latitude
+            lon: customer's longitude
+            visit: whether the customer needs to be visited
+            delivery_day: the required day on which the customer is to be visited
+            delivery_order: the required position in the route in which the customer should be visited
+
+        """
+
+        # IDs (and delivery days) are repeatedly used as dict keys, so intern them
+        # to make their comparisons cheap.
+        self.cust_id = sys.intern(cust_id)
+        self.name = name
+        self.address = address
+        self.lat = latitude
+        self.lon = longitude
+        self.visit = visit
+        self.delivery_day = sys.intern(delivery_day) if delivery_day is not None else None
+        self.delivery_order = delivery_order
+
+    @property
+    def out_dict(self):
+        return {
+            'Name': self.name,
+            'ID': self.cust_id,
+            'Address': self.address,
+        }
+    
+    def __str__(self) -> str:
+        return f"{self.name}; {self.address}"
+    
+    def get_coords(self, lat_first: bool = False) -> Tuple[float, float]:
+        """Returns the customer's coordinates.
+
+        Inputs:
+
+            lat_first: Whether the tuple should be returned as (lat, lon) instead of
+                the default (lon, lat).
+
+        """
+        return (self.lat, self.lon) if lat_first else (self.lon, self.lat)
+    
+
+class CustomerTable():
+    """Column-wise view of a collection of customers, with their coordinates held in contiguous arrays."""
+
+    def __init__(self, customers: Iterable[Customer]):
+        """Creates a CustomerTable.
+
+        Fields:
+
+            ids: customer identifiers, in row order
+            lats: customers' latitudes, in row order
+            lons: customers' longitudes, in row order
+
+        """
+
+        customers = list(customers)
+        self.ids = [customer.cust_id for customer in customers]
+        self.lats = np.fromiter((customer.lat for customer in customers), dtype=np.float64, count=len(customers))
+        self.lons = np.fromiter((customer.lon for customer in customers), dtype=np.float64, count=len(customers))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def get_coords(self, lat_first: bool = False) -> np.ndarray:
+        """Returns the customers' coordinates as an (N, 2) array.
+
+        Inputs:
+
+            lat_first: Whether each row should be (lat, lon) instead of
+                the default (lon, lat).
+
+        """
+        columns = (self.lats, self.lons) if lat_first else (self.lons, self.lats)
+        return np.column_stack(columns)
+
+
+class DistanceTable():
+    """Defines the distances between customers: a dense matrix whose rows and columns are indexed by customer ID.
+
+    Distances are held as whole seconds, since that's what the routing engine works in.
+    """
+
+    # Marks a distance that is not known.
+    MISSING = -1
+
+    def __init__(
+        self,
+        ids: Optional[List[str]] = None,
+        matrix: Optional[np.ndarray] = None,
+    ):
+        """Creates a DistanceTable.
+
+        Fields:
+
+            ids: customer identifiers, in row/column order
+            id_to_idx: row/column index of each customer, keyed on their IDs
+            matrix: int32 distances from the customer of each row to the customer of each column,
+                with MISSING where the distance is not known
+
+        """
+
+        self.ids = [sys.intern(cust_id) for cust_id in ids] if ids is not None else []
+        self.matrix = matrix if matrix is not None else np.empty((0, 0), dtype=np.int32)
+        self.id_to_idx = {cust_id: idx for idx, cust_id in enumerate(self.ids)}
+
+        # Repeated requests for the same customers' distances reuse the same submatrix.
+        self._cached_submatrix = functools.lru_cache(maxsize=32)(self._build_submatrix)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def get_indices(self, cust_ids: Iterable[str]) -> np.ndarray:
+        """Returns the row/column indices of the given customers."""
+        return np.fromiter((self.id_to_idx[cust_id] for cust_id in cust_ids), dtype=np.intp)
+
+    def get_submatrix(self, cust_ids: List[str]) -> np.ndarray:
+        """Returns the distances between the given customers, in the order given.
+
+        The result is read-only, as it may be shared with other callers.
+        """
+        return self._cached_submatrix(tuple(cust_ids))
+
+    def _build_submatrix(self, cust_ids: Tuple[str, ...]) -> np.ndarray:
+        indices = self.get_indices(cust_ids)
+        submatrix = self.matrix[np.ix_(indices, indices)]
+        submatrix.setflags(write=False)
+        return submatrix
+
+    def update(self, new_distances: Dict[Tuple[str, str], float]):
+        """Adds distances keyed on (origin, destination) customer ID pairs, growing the
+        matrix with a row and column for any customer it does not already contain.
+
+        Distances are rounded to whole seconds as they're added. Non-finite or missing
+        (None) distances are stored as MISSING.
+        """
+
+        # Any previously-built submatrices may now be out of date.
+        self._cached_submatrix.cache_clear()
+
+        new_ids = sorted({cust_id for custs_key in new_distances for cust_id in custs_key} - self.id_to_idx.keys())
+
+        # Grow the matrix, marking the not-yet-known distances as missing.
+        if new_ids:
+            n_old = len(self.ids)
+            self.ids = self.ids + new_ids
+            self.id_to_idx.update((cust_id, n_old + i) for i, cust_id in enumerate(new_ids))
+            grown_matrix = np.full((len(self.ids), len(self.ids)), self.MISSING, dtype=np.int32)
+            grown_matrix[:n_old, :n_old] = self.matrix
+            self.matrix = grown_matrix
+
+        # Then fill in the new distances.
+        if new_distances:
+            rows, cols = zip(*((self.id_to_idx[i], self.id_to_idx[j]) for i, j in new_distances))
+            new_values = np.fromiter(new_distances.values(), dtype=np.float64, count=len(new_distances))
+            rounded = np.where(np.isfinite(new_values), np.rint(new_values), self.MISSING)
+            self.matrix[rows, cols] = rounded.astype(np.int32)
+
+
+class RunParams():
+    """Defines a body of parameters controlling the run of the routing engine."""
+
+    def __init__(
+        self,
+        constraints: Optional[Dict]=None,
+        n_routes: Optional[int]=None,
+        time_limit: Optional[int]=None,
+    ):
+        """Creates a RunParams object.
+        
+        Fields:
+
+            constraints: constraints that the routing solution must ensure
+            n_routes: number of routes in the solution.
+            time_limit: number of seconds the routing engine may spend improving the solution.
+
+        """
+
+        self.constraints = constraints if constraints is not None else {}
+        self.n_routes = n_routes if n_routes is not None else 1
+        self.time_limit = time_limit if time_limit is not None else 5
@@ -0,0 +1,250 @@
+from typing import Any, Dict, List, Optional, Tuple
+import datetime
+import functools
+import logging
+import os
+import time
+
+import numpy as np
+from ortools.constraint_solver import routing_enums_pb2
+from ortools.constraint_solver import pywrapcp
+
+from gocheche import utils
+from gocheche.core import Customer, DistanceTable, RunParams
+
+
+def create_model_data(
+    visits: List[str],
+    distances: DistanceTable,
+    params: RunParams
+) -> Dict:
+    """Create the data object necessary to execute the routing engine."""
+    data: Dict[str, Any] = {}
+    data['num_vehicles'] = params.n_routes
+    data['depot'] = 0  # Since we insert it into the zeroth index in utils.load_visits
+    data['distance_matrix'] = np.ascontiguousarray(
+        utils.get_distance_matrix(visits, distances),
+        dtype=np.int32,
+    )
+    return data
+
+
+def _distance_callback(distance_matrix: np.ndarray, idx_to_node: np.ndarray, from_index: int, to_index: int) -> int:
+    """Returns the distance between the nodes at the two routing variable indices."""
+    return int(distance_matrix[idx_to_node[from_index], idx_to_node[to_index]])
+
+
+def register_distances(
+    routing: pywrapcp.RoutingModel,
+    manager: pywrapcp.RoutingIndexManager,
+    distance_matrix: np.ndarray,
+) -> int:
+    """Registers the distance matrix as transit costs with the routing model, and returns
+    the index of the resulting transit callback.
+    """
+
+    # Where possible, hand the matrix itself to the solver, so that it looks arcs
+    # up on the C++ side rather than calling back into Python.
+    if hasattr(routing, 'RegisterTransitMatrix'):
+        return routing.RegisterTransitMatrix(distance_matrix.tolist())
+
+    # Otherwise (older versions of OR-Tools), register a Python callback. Map each
+    # routing variable index to its distance matrix node up front, so that the
+    # callback doesn't have to call back into the index manager.
+    idx_to_node = np.fromiter(
+        (manager.IndexToNode(index) for index in range(manager.GetNumberOfIndices())),
+        dtype=np.int32,
+        count=manager.GetNumberOfIndices(),
+    )
+    return routing.RegisterTransitCallback(
+        functools.partial(_distance_callback, distance_matrix, idx_to_node)
+    )
+
+
+def get_routes(data, manager, routing, solution, visits: List[str], customers: Dict[str, Customer]) -> List[Tuple[List[Customer], int]]:
+    """Retrieves the routes from the solution."""
+    
+    max_route_duration = 0
+    result = []
+
+    # Only bother writing up the routes if they're going to be logged.
+    log_routes = logging.getLogger().isEnabledFor(logging.INFO)
+    
+    # Loop over routes.
+    for vehicle_id in range(data['num_vehicles']):
+
+        # Follow the route from start to end, noting the matrix node of each stop.
+        nodes = []
+        index = routing.Start(vehicle_id)
+        while not routing.IsEnd(index):
+            nodes.append(manager.IndexToNode(index))
+            index = solution.Value(routing.NextVar(index))
+        nodes.append(manager.IndexToNode(index))
+
+        route = [customers[visits[node]] for node in nodes]
+
+        # The route's duration is the sum of the durations of the arcs between consecutive stops.
+        node_idxs = np.asarray(nodes, dtype=np.intp)
+        route_duration = int(data['distance_matrix'][node_idxs[:-1], node_idxs[1:]].sum())
+
+        # Log the result for this route.
+        if log_routes:
+            plan_output = f'Route {vehicle_id}:\n'
+            plan_output += ''.join(f' {cust.name} -> ' for cust in route[:-1])
+            plan_output += f'{route[-1].name}\n'
+            plan_output += f'Duration of the route: {str(datetime.timedelta(seconds=route_duration))}\n'
+            logging.info(plan_output)
+
+        max_route_duration = max(route_duration, max_route_duration)
+
+        # Append it to our solution
+        result.append((route, route_duration))
+    
+    # Note the longest route
+    logging.info('Maximum route duration: %s', datetime.timedelta(seconds=max_route_duration))
+
+    return result
+
+
+def get_routing_solution(
+    visits: List[str],
+    customers: Dict[str, Customer],
+    distances: DistanceTable,
+    params: RunParams,
+    outname: str,
+):
+    """Performs routing and prints a solution.
+
+    Minimizes travel time, ensuring that each customer in visits is visited
+    exactly once.
+    
+    Inputs:
+
+        visits: List of customer IDs that need to be visited
+        
+        customers: Dict of customers, keyed on their IDs.
+        
+        distances: Table of distances between customers
+        
+        params: RunParams object noting parameters for the run
+        
+        outname: Name of the file where results should be stored.
+
+    """
+
+    # Lay the customers out in the distance matrix in geographic order, so that
+    # stops the solver considers together tend to sit close together in memory.
+    visits = utils.order_visits_spatially(visits, customers)
+    
+    data = create_model_data(visits, distances, params)
+
+    # Create the routing index manager.
+    manager = pywrapcp.RoutingIndexManager(
+        len(data['distance_matrix']),
+        data['num_vehicles'],
+        data['depot']
+    )
+
+    # Create Routing Model, letting it cache every arc of the distance matrix in
+    # case its transit costs come from a Python callback.
+    model_parameters = pywrapcp.DefaultRoutingModelParameters()
+    model_parameters.max_callback_cache_size = len(data['distance_matrix']) ** 2
+    routing = pywrapcp.RoutingModel(manager, model_parameters)
+
+    # Register the transit costs.
+    transit_callback_index = register_distances(routing, manager, data['distance_matrix'])
+
+    # Define cost of each arc.
+    routing.SetArcCostEvaluatorOfAllVehicles(transit_callback_index)
+
+    # Add duration constraint.
+    dimension_name = 'duration'
+    routing.AddDimension(
+        transit_callback_index,
+        0,  # no slack
+        28800,  # vehicle maximum travel time (8 hr in s, the unit used in the distance matrix)
+        True,
+        dimension_name)
+    duration_dimension = routing.GetDimensionOrDie(dimension_name)
+    duration_dimension.SetGlobalSpanCostCoefficient(100)
+
+    # Setting first solution heuristic.
+    search_parameters = pywrapcp.DefaultRoutingSearchParameters()
+    search_parameters.first_solution_strategy = (
+        routing_enums_pb2.FirstSolutionStrategy.PATH_CHEAPEST_ARC
+    )
+
+    # Then improve on it with guided local search until we run out of time.
+    search_parameters.local_search_metaheuristic = (
+        routing_enums_pb2.LocalSearchMetaheuristic.GUIDED_LOCAL_SEARCH
+    )
+    search_parameters.time_limit.seconds = params.time_limit
+    search_parameters.log_search = False
+
+    # Solve the problem.
+    solution = routing.SolveWithParameters(search_parameters)
+
+    # If a solution was found...
+    if solution:
+        
+        # First log it and get the list-ified version.
+        routes = get_routes(data, manager, routing, solution, visits, customers)
+
+        # Then, save it to file
+        write_text_solution(routes, outname)
+    
+    else:
+        logging.warning("NO SOLUTION COULD BE FOUND")
+
+def write_text_solution(routes: List[Tuple[List[Customer], int]], outname: str):
+
+    # If no output name was passed, then we'll be dumping a "Coffee Route.txt" file on the desktop
+    if len(outname) == 0:
+        outname = os.path.join(utils.get_known_path(path_type="desktop"), "Coffee Route.txt")
+    
+    if outname.endswith('.json'):
+        
+        writeable_sol_json = {
+            "solution": [
+                {
+                    "route": utils.stringify_route(route),
+                    "duration": duration
+                }
+                for route, duration in routes
+            ]
+        }
+        utils.write_json(writeable_sol_json, outname)
+    
+    else:
+        # Write each piece of the solution out as it's produced, rather than
+        # assembling the whole thing in memory first.
+        with open(outname, 'w', buffering=1 << 16) as outfile:
+        
+            for i, route in enumerate(routes):
+                outfile.write(f"""
+
+            *******************
+            *** ROUTE {i+1}
+            *******************
+            """)
+
+                for j, cust in enumerate(route[0]):
+                    # Don't need to print the return to the depot
+                    if j >= len(route[0]) - 1:
+                        break
+                    
+                    outfile.write(f"""
+                    {j+1}.
+                        Name: {cust.name}
+                        Address: {cust.address}
+                
+                """)
+
+                outfile.write("""
+
+            --- end of route ---
+
+            """)
+
+    logging.info("Wrote %d route(s) to %s", len(routes), outname)
+    print(f"Wrote {len(routes)} route(s) to {outname}")
@@ -1,17 +1,24 @@
+from __future__ import annotations
+
 import argparse
 import datetime
 import logging
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from gocheche._version import __version__
 
-from gocheche.core import Customer, RunParams
-from gocheche import router, utils
+# The routing and data-loading modules pull in OR-Tools, NumPy and the network
+# clients, so they're only imported once we know there's routing to do (and not,
+# e.g., when just asked for --help or --version).
+if TYPE_CHECKING:
+    from gocheche.core import Customer, DistanceTable, RunParams
 
 
 def get_arg_parser() -> argparse.ArgumentParser:
     """Builds our argument parser."""
 
     # Initialize an argument parser.
-    parser = argparse.ArgumentParser(description="Does some CheChe routing.")
+    parser = argparse.ArgumentParser(prog="gocheche", description="Does some CheChe routing.")
 
     # Argument to take in the file with the list of customers to visit.
     parser.add_argument(
@@ -47,6 +54,18 @@ def get_arg_parser() -> argparse.ArgumentParser:
         )
     )
     
+    # Argument to take in the file caching previously geocoded addresses.
+    parser.add_argument(
+        '-g',
+        '--geocodes',
+        type=str,
+        default="data/geocode_cache.json",
+        help=(
+            'Name of file caching previously geocoded addresses. '
+            "Default is geocode_cache.json. If the file doesn't exist, a new file is created."
+        )
+    )
+    
     # Argument to take in the file with routing constraints (namely, which
     # customers need to be served on which days).
     parser.add_argument(
@@ -65,22 +84,30 @@ def get_arg_parser() -> argparse.ArgumentParser:
         help="File with API key for OSR",
     )
 
+    parser.add_argument(
+        '--version',
+        action='version',
+        version=f'%(prog)s {__version__}',
+    )
+
     return parser
 
 
 def fetch_data(args: argparse.Namespace) -> Tuple[
     List[str],
     Dict[str, Customer],
-    Dict[Tuple[str, str], float],
+    DistanceTable,
     RunParams,
 ]:
     """Fetches the data in the files located in the locations indicated by `args`."""
 
+    from gocheche import utils
+
     # Before we do anything, load the API key from file
     api_key = utils.get_api_key(args.api)
     
     # Loading all data files. We first start with the list of customers to visit
-    customers, visits, distances = utils.load_customers(api_key, args.visit, args.customers)
+    customers, visits, distances = utils.load_customers(api_key, args.visit, args.customers, args.geocodes)
     logging.info("Customers and distances retrieved.")
     
     # And lastly the run parameters (constraints).
@@ -93,20 +120,22 @@ def fetch_data(args: argparse.Namespace) -> Tuple[
 def main():
     """Does some CheChe routing."""
 
+    # Initialize the argument parser and retrieve the passed arguments
+    parser = get_arg_parser()
+    args = parser.parse_args()
+
     # Grab the timestamp for when the run was initialized
     now = datetime.datetime.now().strftime("%Y%m%d")
 
     # Initialize a logger.
     logging.basicConfig(filename=f'gocheche_{now}.log', level=logging.INFO)
 
-    # Initialize the argument parser and retrieve the passed arguments
-    parser = get_arg_parser()
-    args = parser.parse_args()
-
     # Fetch and check the data in the files given in args.
     visits, customers, distances, params = fetch_data(args)
 
-    logging.info(f"""
+    # Only assemble the summary of the input if it's going to be logged.
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info(f"""
         *** GoCheChe input ***
 
         Received arguments:
@@ -114,6 +143,7 @@ def main():
             visit: {args.visit}
             output: {args.output}
             customers: {args.customers}
+            geocodes: {args.geocodes}
             params: {args.params}
 
         Customers to visit:
@@ -123,6 +153,7 @@ def main():
     """)
 
     # Do the routing
+    from gocheche import router
     solution = router.get_routing_solution(visits, customers, distances, params, args.output)
 
 
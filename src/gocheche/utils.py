@@ -0,0 +1,744 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+import ast
+import csv
+import functools
+import glob
+import json
+import logging
+import os
+import threading
+import time
+
+from openrouteservice import client, distance_matrix
+from requests.adapters import HTTPAdapter
+import geocoder
+import numpy as np
+import requests
+import usaddress
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from gocheche.core import Customer, CustomerTable, DistanceTable, RunParams
+
+
+DEPOT_CUST_ID = "000000"
+NAME_COL_IDX = 0
+ADDRESS_COL_IDX = 1
+GEOCODE_MAX_WORKERS = 16
+# Most origin-destination pairs that OpenRouteService will return in a single matrix request.
+OSR_MAX_MATRIX_ROUTES = 3500
+# The public Nominatim server used by geocoder.osm allows at most one request per second:
+# https://operations.osmfoundation.org/policies/nominatim/
+GEOCODE_MAX_REQUESTS_PER_SECOND = 1.0
+
+
+class RateLimiter():
+    """Spaces out calls, across threads, so that no more than a given number happen per second."""
+
+    def __init__(self, max_per_second: float):
+        """Creates a RateLimiter.
+
+        Fields:
+
+            interval: minimum number of seconds between consecutive calls
+
+        """
+
+        self.interval = 1.0 / max_per_second
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Blocks until the caller's turn to make a call comes up."""
+
+        # Claim the next free slot...
+        with self._lock:
+            now = time.monotonic()
+            slot_time = max(self._next_time, now)
+            self._next_time = slot_time + self.interval
+
+        # ...then wait for it outside of the lock, so other threads can claim theirs.
+        time.sleep(slot_time - now)
+
+
+_geocode_rate_limiter = RateLimiter(GEOCODE_MAX_REQUESTS_PER_SECOND)
+
+# Share one HTTP session across all geocoding requests, so they reuse connections.
+_geocode_session = requests.Session()
+_geocode_session.mount('https://', HTTPAdapter(pool_connections=GEOCODE_MAX_WORKERS, pool_maxsize=GEOCODE_MAX_WORKERS))
+
+
+def load_json(filename: str) -> Dict:
+    """Returns the JSON file's contents as a dict.
+
+    Uses orjson if it is installed, since it is considerably faster than the
+    standard library on large files (e.g., the known customers' distances).
+    """
+
+    if orjson is not None:
+        with open(filename, 'rb') as json_file:
+            return orjson.loads(json_file.read())
+    
+    with open(filename, 'r') as json_file:
+        return json.load(json_file)
+
+
+def write_json(obj_to_write: Any, filename: str, pretty: bool = True):
+    """Writes the object to a JSON file, using orjson if it is installed.
+
+    If `pretty` is False, the JSON is written without any indentation or
+    extra whitespace.
+    """
+
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+        with open(filename, 'wb') as json_file:
+            json_file.write(orjson.dumps(obj_to_write, option=option))
+        return
+    
+    with open(filename, 'w') as json_file:
+        if pretty:
+            json.dump(obj_to_write, json_file, indent=4)
+        else:
+            json.dump(obj_to_write, json_file, separators=(',', ':'))
+
+
+def ordinal(n: Union[str, int]) -> str:
+    return "%d%s" % (int(n),"tsnrhtdd"[(int(n)//10%10!=1)*(int(n)%10<4)*int(n)%10::4])
+
+def good_geocoder_result(g_json) -> bool:
+    return all(key in g_json for key in ('housenumber', 'street', 'city', 'state', 'postal', 'lat', 'lng'))
+
+def geocode(address: str) -> geocoder.api.OsmQuery:
+    """Geocodes the address with OSM, within our rate limit."""
+
+    _geocode_rate_limiter.wait()
+    return geocoder.osm(address, session=_geocode_session)
+
+
+def get_address(address: str) -> Tuple[str, float, float]:
+    """Gets a geocodable version of `address`, plus its latitude and longitude."""
+
+    # Try to geocode the address as given
+    g = geocode(address)
+
+    if g.json is not None:
+
+        # TODO this is inefficient and hacky
+
+        # First thing we attempt if the result isn't complete is just to
+        # add the housenumber (often the issue).
+        if not good_geocoder_result(g.json):
+            g.json['housenumber'] = usaddress.tag(address)[0]['AddressNumber']
+
+        # If the result is now good, return it
+        if good_geocoder_result(g.json):
+
+            # Geocoding was successful. Return the result
+            return (
+                # First part is a nicely formatted address
+                f"{g.json['housenumber']} {g.json['street']}, {g.json['city']}, {g.json['state']} {g.json['postal']}",
+                # Second is the latitude
+                g.json['lat'],
+                # And third is the longitude
+                g.json['lng']
+            )
+
+    # Geocoding was unsuccessful.
+    # Let's try to create a cleaner address by first parsing out the pieces we need, then try again.
+    
+    # Parsing the address components...
+    parsed, addr_type = usaddress.tag(address)
+    if addr_type != "Street Address":
+        raise ValueError(f"Address could not be properly parsed. Resulting type: {addr_type}. Result: \n{parsed}")
+    
+    # Trim off any whitespace from the parsed components.
+    for part in parsed:
+        parsed[part] = parsed[part].strip()
+
+    reqd_address_parts = ['AddressNumber', 'StreetName', 'PlaceName']
+    if any(address_part not in parsed for address_part in reqd_address_parts):
+        raise ValueError(f"The address must have at least a house number, street, and city.")
+    
+    # Initialize the resulting address string with the address number (aka house/street number)
+    new_address = parsed['AddressNumber']
+    
+    # If the streetname is just a number, make it ordinal
+    if parsed['StreetName'].isnumeric():
+        parsed['StreetName'] = ordinal(parsed['StreetName'])
+    
+    # Get the whole street name
+    for k, v in [(k, v) for k, v in parsed.items() if k.startswith("StreetName")]:
+        new_address += f" {v}"
+    
+    # Add the city...
+    new_address += f", {parsed['PlaceName']}"
+    # Add the state, if it exists
+    if 'StateName' in parsed:
+        new_address += f", {parsed['StateName']}"
+    # And the zip code, if it exists
+    if 'ZipCode' in parsed:
+        new_address += f" {parsed['ZipCode']}"
+    
+    # Now try to geocode this improved address
+    g = geocode(new_address)
+
+    if g.json is not None:
+
+        # Geocoding was successful. Return the result
+        return (
+            # First part is a nicely formatted address
+            f"{g.json['housenumber']} {g.json['street']}, {g.json['city']}, {g.json['state']} {g.json['postal']}",
+            # Second is the latitude
+            g.json['lat'],
+            # And third is the longitude
+            g.json['lng']
+        )
+    
+    # Still can't geocode the address. Throw an error
+    else:
+        raise ValueError(f"Could not geocode this address: {address}")
+
+
+def normalize_address(address: str) -> str:
+    """Returns a normalized version of `address`, for use as a geocoding cache key."""
+
+    return " ".join(address.lower().split())
+
+
+def get_addresses(addresses: List[str], geocode_cache_filename: Optional[str] = None) -> List[Tuple[str, float, float]]:
+    """Gets the geocodable version, latitude, and longitude of each of `addresses`
+    (see `get_address`), in order.
+
+    Each geocoding request is a blocking network round trip, so distinct
+    addresses are geocoded concurrently (while still respecting the
+    geocoder's rate limit).
+
+    If a geocode_cache_filename is given, addresses found in that JSON file
+    are not geocoded again, and newly geocoded addresses are added to it.
+    """
+
+    geocode_cache = (
+        load_json(geocode_cache_filename)
+        if geocode_cache_filename and file_exists(geocode_cache_filename)
+        else {}
+    )
+
+    # Only geocode the distinct addresses we don't already know.
+    uncached_addresses: Dict[str, str] = {}
+    for address in addresses:
+        key = normalize_address(address)
+        if key not in geocode_cache:
+            uncached_addresses.setdefault(key, address)
+
+    if uncached_addresses:
+        with ThreadPoolExecutor(max_workers=GEOCODE_MAX_WORKERS) as executor:
+            futures = {key: executor.submit(get_address, address) for key, address in uncached_addresses.items()}
+
+        # Hold on to whatever was successfully geocoded, even if some addresses failed.
+        for key, future in futures.items():
+            if future.exception() is None:
+                geocode_cache[key] = future.result()
+
+        if geocode_cache_filename:
+            write_json(geocode_cache, geocode_cache_filename)
+
+        # Now surface any failures.
+        for future in futures.values():
+            future.result()
+
+    return [tuple(geocode_cache[normalize_address(address)]) for address in addresses]
+
+
+def load_known_customer_data(customers_filename: Optional[str]) -> Tuple[List[Customer], DistanceTable]:
+    """Loads the list of known customers from customers_filename, along with the
+    distances between them.
+    """
+
+    if not customers_filename or not os.path.exists(customers_filename):
+        # empty list of customers, empty table of distances
+        return [], DistanceTable()
+
+    else:
+        all_cust_data = load_json(customers_filename)
+        custs = [Customer(**customer) for customer in all_cust_data['customers']]
+
+        dists = dist_table_from_json(all_cust_data['distances'])
+
+        # Files written before distances were stored as a matrix are
+        # migrated to the current format the first time they're read.
+        if not is_dist_matrix_json(all_cust_data['distances']):
+            logging.info("Migrating the distances in %s to the matrix format.", customers_filename)
+            write_known_customer_data(custs, dists, customers_filename)
+
+        return custs, dists
+
+
+def load_customers(
+    api_key: str,
+    visits_filename: str,
+    customers_filename: Optional[str],
+    geocode_cache_filename: Optional[str] = None,
+) -> Tuple[Dict[str, Customer], List, DistanceTable]:
+    """Loads customer-related data objects from file:
+        element 0: dict from customer IDs to customer objects
+        element 1: *sorted* list of customer IDs (depot first) that need to be visited
+        element 2: table of distances
+
+    The visits_filename points to a CSV file with a row for each customer that needs to be visited
+        in the current route. Must have columns for customers' names and addresses.
+
+    The customers_filename points to a JSON file that contains a list of known customers, as well as
+    the distances between them.
+        If the filename is None or empty, we do not read any customer info from file.
+        If a filename is provided but it does not exist, we write a new file containing
+            the customers in visits_filename, along with the distances between them.
+        If the file exists and any customers in visits_filename are not already in this file,
+            then we add them to the file, along with their distances.
+
+    The geocode_cache_filename points to a JSON file of previously geocoded addresses.
+        If the filename is None or empty, every address is geocoded.
+        Otherwise, addresses already in the file are not geocoded again, and newly
+            geocoded addresses are added to it.
+
+    """
+
+    # If no visits filename was provided, we assume it was the last modified CSV
+    # in the downloads directory:
+    if len(visits_filename) == 0:
+        visits_filename = get_last_modded_csv(get_known_path(path_type="downloads"))
+
+    # Read in the file that contains known customers and their details.
+    known_customers, distances = load_known_customer_data(customers_filename)
+    new_customers = []
+
+    # Index the known customers for quick lookup.
+    known_by_name_address = {(customer.name, customer.address): customer for customer in known_customers}
+    known_by_id = {customer.cust_id: customer for customer in known_customers}
+    
+    # Initialize the dict of current customers and the list of customer IDs to visit
+    cust_dict = {}
+    visits = [] 
+    duplicates = []
+
+    # Note what will be the next ID that we assign to a customer if we encounter
+    # a new one.
+    # If the list of customers is empty, then we start at 0.
+    next_cust_id = (
+        0 if not known_customers
+        else max(int(customer.cust_id) for customer in known_customers) + 1
+    )
+
+    # Read in the CSV that contains the details of the customers to be visited
+    with open(visits_filename) as csvfile:
+
+        # Should we skip the first row
+        has_header = csv.Sniffer().has_header(csvfile.read(2048))
+
+        # Set our reader back at the beginning.
+        csvfile.seek(0)
+
+        # Now begin reading the file
+        rowreader = csv.reader(csvfile)
+
+        # Skip the header row if need be
+        if has_header:
+            next(rowreader)
+        
+        # Read each customer's information from its row
+        rows = [(row[NAME_COL_IDX], row[ADDRESS_COL_IDX]) for row in rowreader]
+
+    # Geocode all of the addresses up front, concurrently.
+    geocoded_addresses = get_addresses([raw_address for _, raw_address in rows], geocode_cache_filename)
+
+    for (name, _), (address, lat, lon) in zip(rows, geocoded_addresses):
+
+        # It's in the visits file, so we know it needs to be visited.
+        visit = True
+        
+        cust = known_by_name_address.get((name, address))
+        
+        if cust is None:
+            # We're dealing with a new customer
+            logging.info("Found new customer: %s, located at:\n%s", name, address)
+            
+            # Get a new ID for the customer
+            cust_id = f"{next_cust_id:06d}"
+            next_cust_id += 1
+            logging.info("%s given customer ID %s", name, cust_id)
+            
+            # Create a Customer object for this customer
+            cust = Customer(cust_id, name, address, lat, lon, True)
+
+            # Add this customer to our list of new customers (and the indexes of known customers)
+            new_customers.append(cust)
+            known_by_name_address[(name, address)] = cust
+            known_by_id[cust_id] = cust
+        
+        else:
+            cust.visit = visit
+            logging.info("Loading existing customer:\n%s", cust.out_dict)
+
+        # Note any customer that appears in the file more than once.
+        if cust.cust_id in cust_dict:
+            duplicates.append(name)
+
+        cust_dict[cust.cust_id] = cust
+
+        visits.append(cust.cust_id)
+
+    if duplicates:
+        raise ValueError(f"Some customers are duplicated in the visits file: {duplicates}")
+
+    if new_customers:
+        # Get the distances to/from all the new customers from/to the known customers at once
+        new_dists = get_dists_to_from_new_custs(new_customers, known_customers, api_key)
+        logging.info("Distances for %d new customers retrieved.", len(new_customers))
+
+        # Add the new customers to our list of known customers, and their distances to our distances table
+        known_customers.extend(new_customers)
+        distances.update(new_dists)
+
+    # Sort the list of customers to visit by their IDs.
+    visits = sorted(visits)
+
+    # If the depot is not already included in the list of customers to visit, add it in now
+    if DEPOT_CUST_ID not in visits:
+        visits.insert(0, DEPOT_CUST_ID)
+    # ^^ NOTE: Other methods (router.create_model_data) assume depot is in the first slot.
+    # Beware of changing this in the future.
+
+    # Similarly, if the depot is not in our dictionary of customers, then add it now
+    if DEPOT_CUST_ID not in cust_dict.keys():
+        depot_cust = known_by_id.get(DEPOT_CUST_ID)
+        if depot_cust is None:
+            raise ValueError(f"Customer info is required but could not be found for the depot location (ID {DEPOT_CUST_ID}).")
+        cust_dict[DEPOT_CUST_ID] = depot_cust
+    
+    logging.info("IDs of customers to be visited: %s", visits)
+
+    # Save any new customers, and their distances, to the customers file.
+    if new_customers:
+        write_known_customer_data(known_customers, distances, customers_filename)
+    
+    return cust_dict, visits, distances
+
+
+def write_known_customer_data(
+    customers: List[Customer],
+    distances: DistanceTable,
+    customers_filename: Optional[str],
+):
+    """Writes the known customers and the distances between them to customers_filename,
+    straight from memory.
+    """
+
+    # If we're trying to read/write from memory, nothing to do
+    if not customers_filename:
+        return
+
+    custs_data = [
+        {
+            "cust_id": customer.cust_id,
+            "name": customer.name,
+            "address": customer.address,
+            "latitude": customer.lat,
+            "longitude": customer.lon
+        }
+        for customer in customers
+    ]
+
+    # Write the data to file, compactly, since it holds a distance for every pair of customers.
+    output_json = {"customers": custs_data, "distances": dist_table_to_json(distances)}
+    write_json(output_json, customers_filename, pretty=False)
+
+
+def is_dist_matrix_json(json_dists: Dict) -> bool:
+    """Checks whether JSON-compatible distances are in the matrix format written by
+    `dist_table_to_json`, rather than the older format keyed on stringified ID pairs.
+    """
+
+    return set(json_dists.keys()) == {"ids", "durations"}
+
+
+def dist_table_from_json(json_dists: Dict) -> DistanceTable:
+    """Converts JSON-compatible distances into a table of distances.
+
+    The current format holds the customer IDs and a dense matrix of durations
+    (with nulls for missing distances):
+        {"ids": ["000000", ...], "durations": [[0, 123, ...], ...]}
+    The older format, a dictionary keyed on stringified (origin, destination)
+    ID pairs, is also accepted.
+    """
+
+    if not is_dist_matrix_json(json_dists):
+        return dist_table_from_dict(dist_dict_from_json(json_dists))
+
+    ids = json_dists["ids"]
+    durations = np.array(json_dists["durations"], dtype=np.float64).reshape(len(ids), len(ids))
+    matrix = np.where(np.isnan(durations), DistanceTable.MISSING, np.rint(durations)).astype(np.int32)
+    return DistanceTable(ids, matrix)
+
+
+def dist_table_to_json(distances: DistanceTable) -> Dict:
+    """Converts a table of distances into the JSON-compatible matrix format.
+
+    When no distances are missing and orjson is available, the matrix is
+    left as an array for orjson to serialize directly, rather than being
+    converted into N^2 Python objects first.
+    """
+
+    missing = distances.matrix == DistanceTable.MISSING
+
+    durations: Union[np.ndarray, List[List[Optional[int]]]]
+    if not missing.any():
+        durations = distances.matrix if orjson is not None else distances.matrix.tolist()
+    else:
+        durations = [
+            [None if is_missing else dist for dist, is_missing in zip(row, row_missing)]
+            for row, row_missing in zip(distances.matrix.tolist(), missing.tolist())
+        ]
+
+    return {"ids": distances.ids, "durations": durations}
+
+
+def dist_dict_from_json(json_dists: Dict[str, float]) -> Dict[Tuple[str, str], float]:
+    """Converts a distances dictionary in the older JSON-compatible format, keyed on
+    stringified (origin, destination) customer ID pairs, into one keyed on Tuples.
+    """
+
+    return {ast.literal_eval(custs_key): dist for custs_key, dist in json_dists.items()}
+
+
+def dist_table_from_dict(dist_dict: Dict[Tuple[str, str], float]) -> DistanceTable:
+    """Converts a distances dictionary keyed on (origin, destination) customer ID pairs
+    into a table of distances.
+    """
+
+    distances = DistanceTable()
+    distances.update(dist_dict)
+    return distances
+
+
+def file_exists(filename: str) -> bool:
+    """Checks whether the specified file exists."""
+
+    return os.path.exists(filename)
+
+
+def load_params(params_filename: str) -> RunParams:
+    """Loads parameters and constraints from file."""
+    
+    # If no params filename is specified, return the default parameter setting.
+    if not params_filename:
+        return RunParams()
+
+    return RunParams(**load_json(params_filename))
+
+
+@functools.lru_cache(maxsize=1)
+def get_osr_client(osr_api_key: str) -> client.Client:
+    """Returns the openrouteservice client for the API key, reusing it (and its
+    HTTP connections) across requests.
+    """
+
+    return client.Client(key=osr_api_key)
+
+
+def get_durations(
+    osr_client: client.Client,
+    locations: List[List[float]],
+    sources: List[int],
+    destinations: List[int],
+) -> List[List[Optional[float]]]:
+    """Gets the travel durations from each of the `sources` to each of the `destinations`,
+    which index into `locations`.
+
+    The sources are split across as many requests as needed to stay within
+    the routing service's limit on the size of a single matrix.
+    """
+
+    sources_per_request = max(1, OSR_MAX_MATRIX_ROUTES // len(destinations))
+
+    durations = []
+    for first_source in range(0, len(sources), sources_per_request):
+        response = osr_client.distance_matrix(
+            locations=locations,
+            profile='driving-car',
+            metrics=['duration'],
+            sources=sources[first_source:first_source + sources_per_request],
+            destinations=destinations,
+        )
+        durations.extend(response['durations'])
+
+    return durations
+
+
+def get_dists_to_from_new_custs(
+    new_customers: List[Customer],
+    known_customers: List[Customer],
+    osr_api_key: str,
+) -> Dict[Tuple[str, str], float]:
+    """Gets distances to/from new customers from/to the list of known customers (and
+    each other).
+
+    Args:
+        new_customers: the new customers
+        known_customers: known customers
+        osr_api_key: API key to access openservice routing 
+
+    Returns:
+        Distances dictionary with pairwise distances between the new and known customers.
+        Pairs that the routing service could not find a route between are left out.
+    """
+
+    # If there is just the one customer, just return a 0-distance dict for the
+    # single self-directed arc.
+    if len(new_customers) == 1 and not known_customers:
+        return {(new_customers[0].cust_id, new_customers[0].cust_id): 0.0}
+
+    # Get our client to pull the distance matrix.
+    osr_client = get_osr_client(osr_api_key)
+
+    # Lay out the known customers, followed by the new customers, column-wise.
+    cust_table = CustomerTable(known_customers + new_customers)
+    cust_ids = cust_table.ids
+
+    # Note where the new customers, that we need distances for, start.
+    n = len(cust_table)
+    first_new_idx = len(known_customers)
+    all_idxs = list(range(n))
+    new_idxs = all_idxs[first_new_idx:]
+
+    # Note that coordinates are in (lon, lat) order instead of (lat, lon).
+    locations = cust_table.get_coords().tolist()
+
+    # First, get the distances FROM the new customers to all the customers
+    # (including each other, and themselves).
+    durations = get_durations(osr_client, locations, new_idxs, all_idxs)
+    logging.info("Distances *FROM* new customers retrieved")
+    new_distances = {
+        (cust_ids[i], cust_ids[j]): durations[row][j]
+        for row, i in enumerate(new_idxs)
+        for j in all_idxs
+    }
+
+    # Next, get the distances TO the new customers from the existing customers
+    # (distances between new customers were already covered above).
+    if known_customers:
+        durations = get_durations(osr_client, locations, all_idxs[:first_new_idx], new_idxs)
+        logging.info("Distances *TO* new customers retrieved")
+        new_distances.update({
+            (cust_ids[i], cust_ids[j]): durations[i][col]
+            for i in range(first_new_idx)
+            for col, j in enumerate(new_idxs)
+        })
+    
+    return {custs_key: dist for custs_key, dist in new_distances.items() if dist is not None}
+
+
+def _find_missing_distances(visits: List[str], visit_dists: np.ndarray) -> List[Tuple[str, str]]:
+    """Returns the (origin, destination) pairs of customers in `visits` whose distance
+    is missing from `visit_dists`, the distance matrix of those customers.
+    """
+
+    return [(visits[i], visits[j]) for i, j in np.argwhere(visit_dists == DistanceTable.MISSING)]
+
+
+def get_distance_matrix(visits: List[str], distances: DistanceTable) -> np.ndarray:
+    """Produces an (N, N) distance matrix for the customers in `visits`."""
+
+    unknown = set(visits) - distances.id_to_idx.keys()
+    if unknown:
+        raise ValueError(f"No distances are known for some of the customers to be visited: {sorted(unknown)}")
+
+    # Gather the visited customers' rows and columns in a single pass.
+    visit_dists = distances.get_submatrix(visits)
+
+    missing = _find_missing_distances(visits, visit_dists)
+    if missing:
+        raise ValueError(f"Distances are missing between some of the customers to be visited: {missing}")
+
+    return visit_dists
+
+
+def get_hilbert_indices(xs: np.ndarray, ys: np.ndarray, order: int = 16) -> np.ndarray:
+    """Returns the position of each (x, y) point along a Hilbert curve spanning
+    the points' bounding box on a 2^order x 2^order grid.
+    """
+
+    side = 1 << order
+
+    # Snap the points onto the grid.
+    def to_grid(values: np.ndarray) -> np.ndarray:
+        span = values.max() - values.min()
+        scaled = (values - values.min()) / span if span > 0 else np.zeros_like(values)
+        return np.minimum((scaled * side).astype(np.int64), side - 1)
+
+    x, y = to_grid(xs), to_grid(ys)
+    indices = np.zeros_like(x)
+
+    # Walk down the quadrants, from largest to smallest.
+    s = side // 2
+    while s > 0:
+        rx = ((x & s) > 0).astype(np.int64)
+        ry = ((y & s) > 0).astype(np.int64)
+        indices += s * s * ((3 * rx) ^ ry)
+
+        # Rotate the quadrant so that its sub-curve lines up with the others.
+        flip = (ry == 0) & (rx == 1)
+        x = np.where(flip, side - 1 - x, x)
+        y = np.where(flip, side - 1 - y, y)
+        x, y = np.where(ry == 0, y, x), np.where(ry == 0, x, y)
+
+        s //= 2
+
+    return indices
+
+
+def order_visits_spatially(visits: List[str], customers: Dict[str, Customer]) -> List[str]:
+    """Orders the customers in `visits` along a Hilbert curve, so that customers who are
+    near each other are also near each other in the distance matrix.
+
+    The depot stays in the first slot.
+    """
+
+    depot_id, cust_ids = visits[0], visits[1:]
+    if len(cust_ids) < 2:
+        return list(visits)
+
+    cust_table = CustomerTable(customers[cust_id] for cust_id in cust_ids)
+    order = np.argsort(get_hilbert_indices(cust_table.lons, cust_table.lats), kind='stable')
+
+    return [depot_id] + [cust_ids[i] for i in order]
+
+
+def stringify_route(route: List[Customer]) -> List[Dict[str, str]]:
+    stringified_route = [cust.out_dict for cust in route]
+    return stringified_route
+
+
+def get_api_key(filename: str) -> str:
+    """Gets the API key stored in the JSON file under key "key"."""
+    file_contents = load_json(filename)
+    return file_contents["key"]
+
+
+def get_last_modded_csv(directory: str) -> str:
+    """Returns the name of the most recently modified CSV in `directory`."""
+    glob_pattern = os.path.join(directory,"*.csv")
+    list_of_files = glob.glob(glob_pattern)
+    return max(list_of_files, key=os.path.getmtime)
+
+
+def get_known_path(path_type: str = "downloads") -> str:
+    """Returns known default paths for Linux or Windows"""
+    
+    if path_type.lower() not in ['desktop', 'downloads']:
+        raise ValueError("Invalid path_type. Must be either 'desktop' or 'downloads'.")
+    
+    return os.path.join(os.path.expanduser("~"), path_type.lower())
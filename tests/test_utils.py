@@ -0,0 +1,33 @@
+import json
+
+from gocheche import utils
+from gocheche.core import DistanceTable
+
+
+def test_legacy_null_distances_migrate_to_missing(tmp_path):
+    """Nulls in a legacy customers file are loaded as MISSING and written back as null."""
+
+    customers_filename = tmp_path / "customers.json"
+    legacy_data = {
+        "customers": [
+            {"cust_id": cust_id, "name": cust_id, "address": "", "latitude": 0.0, "longitude": 0.0}
+            for cust_id in ("a", "b")
+        ],
+        "distances": {
+            "('a', 'a')": 0,
+            "('a', 'b')": 12.6,
+            "('b', 'a')": None,
+            "('b', 'b')": 0,
+        },
+    }
+    customers_filename.write_text(json.dumps(legacy_data))
+
+    _, distances = utils.load_known_customer_data(str(customers_filename))
+
+    a, b = distances.get_indices(["a", "b"])
+    assert distances.matrix[a, b] == 13
+    assert distances.matrix[b, a] == DistanceTable.MISSING
+
+    migrated = json.loads(customers_filename.read_text())["distances"]
+    assert migrated["ids"] == ["a", "b"]
+    assert migrated["durations"] == [[0, 13], [None, 0]]